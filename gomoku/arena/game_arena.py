@@ -1,6 +1,7 @@
 """Game arena for orchestrating matches."""
 
 import asyncio
+import operator
 import time
 from typing import Dict, List
 from ..core.models import GameState, Player, GameResult, Move
@@ -97,10 +98,22 @@ class GomokuArena:
                 move = await asyncio.wait_for(current_agent.get_move(game.state.copy()), timeout=self.time_limit)
                 move_time = time.time() - move_start
 
-                row, col = move
+                # Accept any integer type (e.g. NumPy ints) but store plain ints in the log
+                position = None  # Stays None if the move is not a usable board position
+                try:
+                    row, col = move
+                except (TypeError, ValueError):
+                    illegal_reason = "Agent returned a malformed move (expected (row, col))"
+                else:
+                    try:
+                        row, col = operator.index(row), operator.index(col)
+                        position = (row, col)
+                        illegal_reason = "Invalid position (occupied or out of bounds)"
+                    except TypeError:
+                        illegal_reason = "Agent returned non-integer coordinates"
 
                 # Make move
-                if not game.make_move(row, col):
+                if position is None or not game.make_move(row, col):
                     # Invalid move - log it before returning
                     # Collect all LLM logs from this turn
                     llm_conversations = []
@@ -112,16 +125,23 @@ class GomokuArena:
                         {
                             "move_number": len(game.state.move_history) + 1,  # Would have been next move
                             "player": current_agent.agent_id,
-                            "position": (row, col),
+                            "position": position,
                             "time": move_time,
                             "illegal": True,
-                            "reason": "Invalid position (occupied or out of bounds)",
+                            "timeout": False,
+                            "reason": illegal_reason,
                             "llm_conversations": llm_conversations,
                         }
                     )
                     
+                    if position is not None:
+                        invalid_move_reason = f"Invalid move by {current_agent.agent_id} at ({row}, {col})"
+                    else:
+                        invalid_move_reason = f"Invalid move by {current_agent.agent_id} {move!r}: {illegal_reason}"
+
                     if verbose:
-                        print(f"Invalid move by {current_agent.agent_id}: ({row}, {col})")
+                        shown_move = f"({row}, {col})" if position is not None else repr(move)
+                        print(f"Invalid move by {current_agent.agent_id}: {shown_move}")
                         print("Final board:")
                         print(self.board_to_string(game.state))
 
@@ -131,7 +151,7 @@ class GomokuArena:
                         "loser": current_agent.agent_id,
                         "result": GameResult.INVALID_MOVE,
                         "result_code": GameResult.INVALID_MOVE.get_code(),
-                        "reason": f"Invalid move by {current_agent.agent_id} at ({row}, {col})",
+                        "reason": invalid_move_reason,
                         "moves": len(game.state.move_history),
                         "game_log": game_log,
                         "final_board": game.state.board,
@@ -214,6 +234,7 @@ class GomokuArena:
                         "position": None,  # No position for timeout
                         "time": self.time_limit,  # Time limit exceeded
                         "illegal": True,
+                        "timeout": True,
                         "reason": f"Timeout (>{self.time_limit}s)",
                         "llm_conversations": [],  # Can't collect logs on timeout
                     }
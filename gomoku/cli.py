@@ -3,6 +3,7 @@
 import argparse
 import asyncio
 import json
+import time
 from pathlib import Path
 from .discovery import AgentLoader
 from .arena.game_arena import GomokuArena
@@ -268,7 +269,7 @@ async def play_game(loader: AgentLoader, agent1_spec: str, agent2_spec: str, arg
                         "agent2": agent2_spec,
                         "board_size": args.board_size,
                         "time_limit": args.time_limit,
-                        "timestamp": __import__('time').time()
+                        "timestamp": time.time()
                     },
                     "game_result": _serialize_game_result(result)
                 }
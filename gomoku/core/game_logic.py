@@ -1,12 +1,13 @@
 """Core Gomoku game logic."""
 
 from typing import List, Tuple, Optional
-from .models import Player, GameState, Move
+from .models import Player, GameState, Move, DIRECTIONS
 
 
 def _create_empty_board(board_size: int = 15) -> List[List[str]]:
     """Create empty board."""
-    return [[Player.EMPTY.value for _ in range(board_size)] for _ in range(board_size)]
+    empty = Player.EMPTY.value
+    return [[empty] * board_size for _ in range(board_size)]
 
 
 class GomokuGame:
@@ -59,12 +60,11 @@ class GomokuGame:
     def find_winning_sequence(self, winning_player: Player) -> List[Tuple[int, int]]:
         """Find the winning sequence of 5 positions."""
         player_piece = winning_player.value
-        directions = [(0, 1), (1, 0), (1, 1), (1, -1)]  # horizontal, vertical, diagonals
 
         for row in range(self.state.board_size):
             for col in range(self.state.board_size):
                 if self.state.board[row][col] == player_piece:
-                    for dr, dc in directions:
+                    for dr, dc in DIRECTIONS:
                         sequence = [(row, col)]
                         # Check forward direction
                         r, c = row + dr, col + dc
@@ -12,6 +12,10 @@ class Player(Enum):
     EMPTY = "."
 
 
+# Line directions checked for five in a row: horizontal, vertical, diagonals
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
 class GameResult(Enum):
     # Normal game endings
     BLACK_WIN = "black_win"              # Code: BW - Black wins by getting 5 in a row
@@ -28,32 +32,27 @@ class GameResult(Enum):
     
     def get_code(self) -> str:
         """Get standardized 2-letter code for this result."""
-        code_map = {
-            GameResult.BLACK_WIN: "BW",
-            GameResult.WHITE_WIN: "WW", 
-            GameResult.DRAW: "DR",
-            GameResult.INVALID_MOVE: "IM",
-            GameResult.TIMEOUT: "TO",
-            GameResult.EXCEPTION: "EX",
-            GameResult.RESIGNATION: "RS",
-        }
-        return code_map.get(self, "UK")  # UK = Unknown
+        return _RESULT_TO_CODE.get(self, "UK")  # UK = Unknown
     
     @classmethod
     def from_code(cls, code: str) -> 'GameResult':
         """Get GameResult from 2-letter code."""
-        code_map = {
-            "BW": cls.BLACK_WIN,
-            "WW": cls.WHITE_WIN,
-            "DR": cls.DRAW,
-            "IM": cls.INVALID_MOVE,
-            "TO": cls.TIMEOUT,
-            "EX": cls.EXCEPTION,
-            "RS": cls.RESIGNATION,
-        }
-        if code not in code_map:
+        if code not in _CODE_TO_RESULT:
             raise ValueError(f"Unknown game result code: {code}")
-        return code_map[code]
+        return _CODE_TO_RESULT[code]
+
+
+# Result code lookup tables, built once at import time
+_RESULT_TO_CODE = {
+    GameResult.BLACK_WIN: "BW",
+    GameResult.WHITE_WIN: "WW",
+    GameResult.DRAW: "DR",
+    GameResult.INVALID_MOVE: "IM",
+    GameResult.TIMEOUT: "TO",
+    GameResult.EXCEPTION: "EX",
+    GameResult.RESIGNATION: "RS",
+}
+_CODE_TO_RESULT = {code: result for result, code in _RESULT_TO_CODE.items()}
 
 
 @dataclass
@@ -119,9 +118,8 @@ class GameState:
             return False
 
         player = self.board[row][col]
-        directions = [(0, 1), (1, 0), (1, 1), (1, -1)]  # horizontal, vertical, diagonals
 
-        for dr, dc in directions:
+        for dr, dc in DIRECTIONS:
             count = 1  # Current piece
             count += self._check_direction(row, col, dr, dc, player)
             count += self._check_direction(row, col, -dr, -dc, player)
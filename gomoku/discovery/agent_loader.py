@@ -42,6 +42,9 @@ class AgentMetadata:
 class AgentLoader:
     """Dynamic agent loader for local folders and GitHub repositories."""
 
+    # Manifests are a handful of fields; anything larger is rejected unread
+    _MAX_MANIFEST_BYTES = 16 * 1024
+
     def __init__(self, temp_dir: Optional[str] = None, include_builtin: bool = True):
         self.temp_dir = temp_dir or tempfile.mkdtemp(prefix="gomoku_agents_")
         self.discovered_agents: Dict[str, AgentMetadata] = {}
@@ -141,6 +144,10 @@ class AgentLoader:
     def _parse_manifest(self, manifest_path: Path, source_type: str, source_path: str) -> Optional[AgentMetadata]:
         """Parse an agent.json manifest file."""
         try:
+            manifest_size = manifest_path.stat().st_size
+            if manifest_size > self._MAX_MANIFEST_BYTES:
+                raise ValueError(f"Manifest too large: {manifest_size} bytes (limit {self._MAX_MANIFEST_BYTES})")
+
             with open(manifest_path, "r", encoding="utf-8") as f:
                 manifest = json.load(f)
 
@@ -263,12 +270,17 @@ class AgentLoader:
 
     def _load_agent_class(self, metadata: AgentMetadata) -> Type[Agent]:
         """Load an agent class from its metadata."""
+        # Reuse the cached class instead of re-executing the agent module
+        if metadata.name in self.loaded_classes:
+            return self.loaded_classes[metadata.name]
+
         manifest_path = Path(metadata.manifest_path)
         agent_dir = manifest_path.parent
 
         # Add agent directory to Python path temporarily
         agent_dir_str = str(agent_dir)
-        if agent_dir_str not in sys.path:
+        added_to_path = agent_dir_str not in sys.path
+        if added_to_path:
             sys.path.insert(0, agent_dir_str)
 
         try:
@@ -282,7 +294,7 @@ class AgentLoader:
 
             # Import the module
             module_path = agent_dir / f"{module_name.replace('.', os.sep)}.py"
-            if not module_path.exists():
+            if not module_path.is_file():
                 raise FileNotFoundError(f"Module file not found: {module_path}")
 
             spec = importlib.util.spec_from_file_location(module_name, module_path)
@@ -304,9 +316,12 @@ class AgentLoader:
             return agent_class
 
         finally:
-            # Clean up sys.path
-            if agent_dir_str in sys.path:
-                sys.path.remove(agent_dir_str)
+            # Clean up sys.path, leaving entries that were there before us
+            if added_to_path:
+                try:
+                    sys.path.remove(agent_dir_str)
+                except ValueError:
+                    pass
 
     def get_agent(self, agent_name: str, instance_id: Optional[str] = None) -> Agent:
         """Load and instantiate an agent by name."""
@@ -88,7 +88,7 @@ class JSONToHTMLConverter:
         
         # Create move history with board states
         board_states = []
-        current_board = [['.' for _ in range(board_size)] for _ in range(board_size)]
+        current_board = [['.'] * board_size for _ in range(board_size)]
         board_states.append([row[:] for row in current_board])  # Initial empty board
         
         for move in moves:
@@ -427,9 +427,13 @@ class JSONToHTMLConverter:
             
             if move.get('illegal', False):
                 # Handle illegal moves
-                if move['position'] is None:
+                # Logs written before the timeout marker existed only had timeouts without a position
+                if move.get('timeout', move['position'] is None):
                     # Timeout case
                     position_text = f"TIMEOUT - {move.get('reason', 'Unknown error')}"
+                elif move['position'] is None:
+                    # Unusable move value (e.g. non-integer coordinates)
+                    position_text = f"ILLEGAL MOVE - {move.get('reason', 'Invalid position')}"
                 else:
                     # Invalid position case
                     position_text = f"ILLEGAL MOVE: ({move['position'][0]}, {move['position'][1]}) - {move.get('reason', 'Invalid position')}"
@@ -557,8 +561,11 @@ class JSONToHTMLConverter:
             if (currentMove > 0) {{
                 const move = moves[currentMove - 1];
                 if (move.illegal) {{
-                    if (move.position === null) {{
+                    const isTimeout = ('timeout' in move) ? move.timeout : move.position === null;
+                    if (isTimeout) {{
                         currentPlayerText = `${{move.player}} - TIMEOUT (${{move.reason || 'Unknown error'}})`;
+                    }} else if (move.position === null) {{
+                        currentPlayerText = `${{move.player}} - ILLEGAL MOVE - ${{move.reason || 'Invalid position'}}`;
                     }} else {{
                         const row = move.position[0];
                         const col = move.position[1];